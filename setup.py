@@ -18,7 +18,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.5",
-    install_requires=["click", "click-plugins"],
+    install_requires=["click"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Environment :: Console",
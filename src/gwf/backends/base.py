@@ -1,7 +1,7 @@
 import logging
 from enum import Enum
-from pkg_resources import iter_entry_points
 
+from ..compat import iter_entry_points
 from ..utils import PersistableDict, retry
 from .exceptions import BackendError, DependencyError, TargetError
 from .logmanager import FileLogManager
@@ -12,10 +12,6 @@ logger = logging.getLogger(__name__)
 __all__ = ("Backend", "Status")
 
 
-def _load_backends():
-    return {ep.name: ep.load() for ep in iter_entry_points("gwf.backends")}
-
-
 class Status(Enum):
     """Status of a target.
 
@@ -42,7 +38,7 @@ class Backend:
     @classmethod
     def list(cls):
         """Return the names of all registered backends."""
-        return set(_load_backends().keys())
+        return {ep.name for ep in iter_entry_points("gwf.backends")}
 
     @classmethod
     def from_name(cls, name):
@@ -56,7 +52,9 @@ class Backend:
         :arg str name: Path to a workflow file, optionally specifying a
             workflow object in that file.
         """
-        return _load_backends()[name]
+        for ep in iter_entry_points("gwf.backends", name=name):
+            return ep.load()
+        raise KeyError(name)
 
     @classmethod
     def from_config(cls, config):
@@ -89,20 +87,23 @@ class Backend:
         :func:`submit` directly, unless you want to manually deal with with
         injection of option defaults.
         """
-        new_options = dict(self.option_defaults)
-        new_options.update(target.options)
-
-        for option_name, option_value in list(new_options.items()):
-            if option_name not in self.option_defaults.keys():
+        option_defaults = self.option_defaults
+        new_options = dict(option_defaults)
+        for option_name, option_value in target.options.items():
+            if option_name in option_defaults:
+                new_options[option_name] = option_value
+            else:
                 logger.warning(
-                    'Option "{}" used in "{}" is not supported by backend. Ignored.'.format(
-                        option_name, target.name
-                    )
+                    'Option "%s" used in "%s" is not supported by backend. Ignored.',
+                    option_name,
+                    target.name,
                 )
-                del new_options[option_name]
-            elif option_value is None:
-                del new_options[option_name]
-        target.options = new_options
+
+        target.options = {
+            option_name: option_value
+            for option_name, option_value in new_options.items()
+            if option_value is not None
+        }
 
         self.submit(target, dependencies)
 
@@ -203,6 +203,7 @@ class LocalBackend(Backend):
 
     def close(self):
         self._tracked.persist()
+        self.client.close()
 
 
 class Worker:
@@ -1,12 +1,12 @@
 import logging
 import os
-from pkg_resources import iter_entry_points
+import traceback
 
 import click
-from click_plugins import with_plugins
 
 from . import __version__
 from .backends import Backend
+from .compat import iter_entry_points
 from .conf import config
 from .exceptions import ConfigurationError
 from .utils import ColorFormatter, ensure_dir, get_latest_version
@@ -29,10 +29,14 @@ VERBOSITY_LEVELS = ["warning", "debug", "info", "error"]
 
 
 def get_level(level):
-    return getattr(logging, level.upper())
+    value = logging.getLevelName(level.upper())
+    if not isinstance(value, int):
+        raise ConfigurationError('Invalid verbosity level "{}".'.format(level))
+    return value
 
 
 def configure_logging(level_name):
+    level = get_level(level_name)
     fmt = LOGGING_FORMATS[level_name]
 
     handler = logging.StreamHandler()
@@ -40,7 +44,62 @@ def configure_logging(level_name):
 
     root = logging.getLogger()
     root.addHandler(handler)
-    root.setLevel(get_level(level_name))
+    root.setLevel(level)
+
+
+class BrokenCommand(click.Command):
+    """Stand-in for a plugin command which could not be loaded.
+
+    The command is still listed, but invoking it shows the error raised while
+    loading the plugin instead of running it.
+    """
+
+    def __init__(self, name, error):
+        super().__init__(name)
+        self.help = (
+            "Warning: plugin could not be loaded. Contact its author for "
+            "help.\n\n\b\n" + error
+        )
+        self.short_help = "Warning: could not load plugin. See `gwf {} --help`.".format(
+            name
+        )
+
+    def invoke(self, ctx):
+        click.echo(self.help, color=ctx.color)
+        ctx.exit(1)
+
+    def parse_args(self, ctx, args):
+        return args
+
+
+class PluginGroup(click.Group):
+    """A command group which loads its commands from entry points on demand.
+
+    Commands registered under the `gwf.plugins` entry point group are only
+    imported when they are actually invoked (or when all commands need to be
+    listed, e.g. for the help message). This keeps startup fast since running
+    a single command does not require importing all other commands.
+    """
+
+    def __init__(self, *args, entry_point_group="gwf.plugins", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entry_point_group = entry_point_group
+
+    def list_commands(self, ctx):
+        names = set(self.commands)
+        names.update(ep.name for ep in iter_entry_points(self.entry_point_group))
+        return sorted(names)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands:
+            for ep in iter_entry_points(self.entry_point_group, name=cmd_name):
+                try:
+                    command = ep.load()
+                except Exception:
+                    command = BrokenCommand(cmd_name, traceback.format_exc())
+                self.add_command(command, name=cmd_name)
+                break
+        return self.commands.get(cmd_name)
 
 
 def _validate_choice(key, value, valid_values, human_values=None):
@@ -75,8 +134,7 @@ def validate_check_updates(value):
     return _validate_bool("check_updates", value)
 
 
-@with_plugins(iter_entry_points("gwf.plugins"))
-@click.group(context_settings={"obj": {}})
+@click.group(cls=PluginGroup, context_settings={"obj": {}})
 @click.version_option(version=__version__)
 @click.option("-f", "--file", default="workflow.py:gwf", help="Workflow/obj to load.")
 @click.option(
@@ -10,3 +10,27 @@ except ImportError:
         if hasattr(path, "__fspath__"):
             return path.__fspath__()
         return str(path)
+
+
+def iter_entry_points(group, name=None):
+    """Return an iterable of entry points in `group`.
+
+    If `name` is given, only entry points with that name are returned.
+
+    Uses :mod:`importlib.metadata` when available (Python 3.8+) since it is
+    much cheaper to import than :mod:`pkg_resources`, which is only used as a
+    fallback on older versions of Python.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        from pkg_resources import iter_entry_points as _iter_entry_points
+
+        return _iter_entry_points(group, name)
+
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        eps = eps.select(group=group)
+    else:
+        eps = eps.get(group, ())
+    return [ep for ep in eps if name is None or ep.name == name]
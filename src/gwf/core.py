@@ -1,15 +1,16 @@
-import collections
+import copy
 import logging
 import os
 import os.path
 import unicodedata
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Mapping
 from enum import Enum
 
 from .backends import Status
 from .compat import fspath
 from .exceptions import NameError, WorkflowError
-from .utils import cache, is_valid_name, timer
+from .utils import is_valid_name, timer
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ def _flatten(t):
     def flatten_rec(g):
         if isinstance(g, str) or hasattr(g, "__fspath__"):
             res.append(g)
-        elif isinstance(g, collections.abc.Mapping):
+        elif isinstance(g, Mapping):
             for k, v in g.items():
                 flatten_rec(v)
         else:
@@ -254,11 +255,51 @@ class Target(AnonymousTarget):
             protect=protect,
         )
 
+    # The flattened inputs and outputs are computed on first access and kept
+    # until inputs, outputs or the working directory is reassigned, since the
+    # graph and the scheduler ask for them several times per target.
+
+    @property
+    def inputs(self):
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self, value):
+        self._inputs = value
+        self._flattened_inputs = None
+
+    @property
+    def outputs(self):
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self, value):
+        self._outputs = value
+        self._flattened_outputs = None
+
+    @property
+    def working_dir(self):
+        return self._working_dir
+
+    @working_dir.setter
+    def working_dir(self, value):
+        self._working_dir = value
+        self._flattened_inputs = None
+        self._flattened_outputs = None
+
     def flattened_inputs(self):
-        return _norm_paths(self.working_dir, _flatten(self.inputs))
+        if self._flattened_inputs is None:
+            self._flattened_inputs = _norm_paths(
+                self.working_dir, _flatten(self.inputs)
+            )
+        return self._flattened_inputs
 
     def flattened_outputs(self):
-        return _norm_paths(self.working_dir, _flatten(self.outputs))
+        if self._flattened_outputs is None:
+            self._flattened_outputs = _norm_paths(
+                self.working_dir, _flatten(self.outputs)
+            )
+        return self._flattened_outputs
 
     @classmethod
     def empty(cls, name):
@@ -270,6 +311,19 @@ class Target(AnonymousTarget):
             name=name, inputs=[], outputs=[], options={}, working_dir=os.getcwd()
         )
 
+    def clone(self, name=None):
+        """Return a copy of this target, optionally with a new `name`.
+
+        The options and protected files of the copy can be changed without
+        affecting this target. Inputs and outputs are shared with this target.
+        """
+        new_target = copy.copy(self)
+        new_target.options = dict(self.options)
+        new_target.protected = set(self.protected)
+        if name is not None:
+            new_target.name = name
+        return new_target
+
     def qualname(self, namespace):
         if namespace is not None:
             return "{}.{}".format(namespace, self.name)
@@ -322,6 +376,17 @@ class Graph:
         Raised if the workflow contains a circular dependency.
     """
 
+    __slots__ = (
+        "targets",
+        "provides",
+        "dependencies",
+        "dependents",
+        "unresolved",
+        "_topological_order",
+        "_topological_index",
+        "_dfs_cache",
+    )
+
     def __init__(self, targets, provides, dependencies, dependents, unresolved):
         self.targets = targets
         self.provides = provides
@@ -329,6 +394,10 @@ class Graph:
         self.dependents = dependents
         self.unresolved = unresolved
 
+        self._topological_order = None
+        self._topological_index = None
+        self._dfs_cache = {}
+
         self._check_for_circular_dependencies()
 
     @classmethod
@@ -368,12 +437,13 @@ class Graph:
                         raise WorkflowError(msg)
                     provides[path] = target
 
-        for target in targets:
-            for path in target.flattened_inputs():
-                if path in provides:
-                    dependencies[target].add(provides[path])
-                else:
-                    unresolved.add(path)
+            for target in targets:
+                for path in target.flattened_inputs():
+                    provider = provides.get(path)
+                    if provider is not None:
+                        dependencies[target].add(provider)
+                    else:
+                        unresolved.add(path)
 
         for target, deps in dependencies.items():
             for dep in deps:
@@ -400,39 +470,75 @@ class Graph:
         nodes = self.targets.values()
         state = dict((n, fresh) for n in nodes)
 
-        def visitor(node):
+        for node in nodes:
+            if state[node] != fresh:
+                continue
+
             state[node] = started
-            for dep in self.dependencies[node]:
-                if state[dep] == started:
-                    raise WorkflowError("Target {} depends on itself.".format(node))
-                elif state[dep] == fresh:
-                    visitor(dep)
-            state[node] = done
+            stack = [(node, iter(self.dependencies[node]))]
+            while stack:
+                current, deps = stack[-1]
+                for dep in deps:
+                    if state[dep] == started:
+                        raise WorkflowError(
+                            "Target {} depends on itself.".format(current)
+                        )
+                    elif state[dep] == fresh:
+                        state[dep] = started
+                        stack.append((dep, iter(self.dependencies[dep])))
+                        break
+                else:
+                    state[current] = done
+                    stack.pop()
 
-        for node in nodes:
-            if state[node] == fresh:
-                visitor(node)
+    def topological_order(self):
+        """Return a list of all targets in topological order.
+
+        Every target in the list comes after all of its dependencies. The
+        order is computed once and then cached on the graph.
+        """
+        if self._topological_order is None:
+            remaining = {
+                target: len(self.dependencies.get(target, ()))
+                for target in self.targets.values()
+            }
+            queue = deque(target for target, num in remaining.items() if num == 0)
+            order = []
+            while queue:
+                target = queue.popleft()
+                order.append(target)
+                for dependent in self.dependents.get(target, ()):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        queue.append(dependent)
+            self._topological_order = order
+            self._topological_index = {target: idx for idx, target in enumerate(order)}
+        return self._topological_order
 
     def endpoints(self):
         """Return a set of all targets that are not depended on by other targets."""
         return set(self.targets.values()) - set(self.dependents.keys())
 
-    @cache
     def dfs(self, root):
-        """Return the depth-first traversal path through a graph from `root`."""
-        visited = set()
-        path = []
-
-        def dfs_inner(node):
-            if node in visited:
-                return
-
-            visited.add(node)
-            for dep in self.dependencies[node]:
-                dfs_inner(dep)
-            path.append(node)
+        """Return `root` and all of its dependencies in topological order.
 
-        dfs_inner(root)
+        Every target in the returned list comes after all of its dependencies,
+        and `root` is always the last target. The result is cached per root.
+        """
+        path = self._dfs_cache.get(root)
+        if path is None:
+            visited = {root}
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                for dep in self.dependencies.get(node, ()):
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append(dep)
+
+            self.topological_order()
+            path = sorted(visited, key=self._topological_index.__getitem__)
+            self._dfs_cache[root] = path
         return path
 
     def subset(self, endpoints):
@@ -467,14 +573,17 @@ class CachedFilesystem:
         self._cache = {}
 
     def _lookup_file(self, path):
-        if path not in self._cache:
-            try:
-                st = os.stat(path)
-            except FileNotFoundError:
-                self._cache[path] = None
-            else:
-                self._cache[path] = st.st_mtime
-        return self._cache[path]
+        try:
+            return self._cache[path]
+        except KeyError:
+            pass
+
+        try:
+            changed_at = os.stat(path).st_mtime
+        except FileNotFoundError:
+            changed_at = None
+        self._cache[path] = changed_at
+        return changed_at
 
     def exists(self, path):
         return self._lookup_file(path) is not None
@@ -487,14 +596,15 @@ class CachedFilesystem:
 
 
 class Scheduler:
-    def __init__(self, filesystem=CachedFilesystem()):
+    def __init__(self, filesystem=None):
         """
-        :param gwf.Graph graph:
-            Graph of the workflow.
-        :param gwf.backends.Backend backend:
-            An instance of :class:`gwf.backends.Backend` to which targets will
-            be submitted.
+        :param filesystem:
+            A filesystem abstraction used for looking up whether files exist
+            and when they were changed. Defaults to a new
+            :class:`CachedFilesystem`.
         """
+        if filesystem is None:
+            filesystem = CachedFilesystem()
         self._filesystem = filesystem
         self._scheduled = {}
         self._reasons = {}
@@ -508,55 +618,93 @@ class Scheduler:
 
         logger.debug("Scheduling %d target(s)", len(targets))
         with timer("Scheduled targets in %.3fms", logger=logger):
-            for target in targets:
-                self._schedule_dependencies(target, graph)
+            # graph.dfs() lists a target after all of its dependencies, so the
+            # scheduling decision for every dependency has been made when we
+            # get to a target.
+            for root in targets:
+                for target in graph.dfs(root):
+                    if target not in self._reasons:
+                        self._schedule_target(target, graph)
 
         return self._scheduled, self._reasons
 
-    @cache
-    def _schedule_dependencies(self, target, graph):
+    def _schedule_target(self, target, graph):
         logger.debug("Scheduling target %s", target)
-        scheduled_deps = set(
+        scheduled_deps = [
             dependency
             for dependency in graph.dependencies[target]
-            if self._schedule_dependencies(dependency, graph)
-        )
-        should_schedule, reason = self.should_schedule(target, graph)
-        is_scheduled = scheduled_deps or should_schedule
-        if is_scheduled:
-            self._scheduled[target] = scheduled_deps
+            if dependency in self._scheduled
+        ]
+        if scheduled_deps:
+            self._scheduled[target] = set(scheduled_deps)
+            self._reasons[target] = (
+                "{} was scheduled because its dependency {} was scheduled".format(
+                    target, scheduled_deps[0]
+                )
+            )
+            return
+
+        should_schedule, reason = self._should_schedule_files(target, graph)
+        if should_schedule:
+            self._scheduled[target] = set()
         self._reasons[target] = reason
-        return is_scheduled
 
-    @cache
     def should_schedule(self, target, graph):
-        """Return whether a target should be run or not."""
-
-        for dep in graph.dependencies[target]:
-            should_run, _ = self.should_schedule(dep, graph)
-            if should_run:
-                return (
-                    True,
-                    "{} was scheduled because its dependency {} was scheduled".format(
-                        target, dep
-                    ),
-                )
+        """Return whether a target should be run or not, and the reason why.
 
+        The target and its dependencies will be scheduled, unless this has
+        already been done.
+        """
+        if target not in self._reasons:
+            # Only visit dependencies which haven't been decided yet, so that
+            # asking for every target in turn stays linear in the graph size.
+            stack = [(target, False)]
+            while stack:
+                node, deps_done = stack.pop()
+                if node in self._reasons:
+                    continue
+                if deps_done:
+                    self._schedule_target(node, graph)
+                    continue
+                stack.append((node, True))
+                for dep in graph.dependencies.get(node, ()):
+                    if dep not in self._reasons:
+                        stack.append((dep, False))
+        return target in self._scheduled, self._reasons[target]
+
+    def _should_schedule_files(self, target, graph):
+        """Return whether a target should run judging by its files alone.
+
+        This assumes that none of the dependencies of `target` have been
+        scheduled.
+        """
         # Check whether all input files actually exists are are being provided
-        # by another target. If not, it's an error.
+        # by another target. If not, it's an error. While at it, collect the
+        # timestamps of the input files so that we only have to look them up
+        # once. Timestamps and paths are kept in separate lists such that the
+        # youngest/oldest file can be found without comparing tuples.
+        in_paths, in_ts = [], []
         for path in target.flattened_inputs():
-            if path in graph.unresolved and not self._filesystem.exists(path):
-                msg = (
-                    'File "{}" is required by "{}", but does not exist and is not '
-                    "provided by any target in the workflow."
-                ).format(path, target)
-                raise WorkflowError(msg)
+            try:
+                in_ts.append(self._filesystem.changed_at(path))
+                in_paths.append(path)
+            except FileNotFoundError:
+                if path in graph.unresolved:
+                    msg = (
+                        'File "{}" is required by "{}", but does not exist and is '
+                        "not provided by any target in the workflow."
+                    ).format(path, target)
+                    raise WorkflowError(msg) from None
 
         if target.is_sink:
             return (True, "{} was scheduled because it is a sink".format(target))
 
+        out_paths, out_ts = [], []
         for path in target.flattened_outputs():
-            if not self._filesystem.exists(path):
+            try:
+                out_ts.append(self._filesystem.changed_at(path))
+                out_paths.append(path)
+            except FileNotFoundError:
                 return (
                     True,
                     "{} was scheduled because its output file {} does not exist".format(
@@ -570,10 +718,20 @@ class Scheduler:
                 "{} was not scheduled because it is a source".format(target),
             )
 
-        youngest_in_ts, youngest_in_path = max(
-            (self._filesystem.changed_at(path), path)
-            for path in target.flattened_inputs()
-        )
+        youngest_in_ts = max(in_ts)
+        oldest_out_ts = min(out_ts)
+        is_outdated = youngest_in_ts > oldest_out_ts
+
+        # The paths of the youngest input and oldest output file are only
+        # needed for the reason and for debug logging, so don't look them up
+        # if the target is up to date and debug logging is disabled.
+        if not is_outdated and not logger.isEnabledFor(logging.DEBUG):
+            return (
+                False,
+                "{} was not scheduled because it is up to date".format(target),
+            )
+
+        youngest_in_path = in_paths[in_ts.index(youngest_in_ts)]
         logger.debug(
             "%s is the youngest input file of %s with timestamp %s",
             youngest_in_path,
@@ -581,18 +739,15 @@ class Scheduler:
             youngest_in_ts,
         )
 
-        oldest_out_ts, oldest_out_path = min(
-            (self._filesystem.changed_at(path), path)
-            for path in target.flattened_outputs()
-        )
+        oldest_out_path = out_paths[out_ts.index(oldest_out_ts)]
         logger.debug(
             "%s is the oldest output file of %s with timestamp %s",
             oldest_out_path,
             target,
-            youngest_in_ts,
+            oldest_out_ts,
         )
 
-        if youngest_in_ts > oldest_out_ts:
+        if is_outdated:
             return (
                 True,
                 "{} was scheduled because input file {} is newer than output file {}".format(
@@ -602,7 +757,7 @@ class Scheduler:
         return (False, "{} was not scheduled because it is up to date".format(target))
 
 
-def schedule(targets, graph, filesystem=CachedFilesystem()):
+def schedule(targets, graph, filesystem=None):
     """Schedule one or more targets.
 
     Scheduling a target will determine whether the target needs to run.
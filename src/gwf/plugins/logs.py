@@ -21,9 +21,8 @@ def logs(obj, target, stderr, no_pager):
     if target not in workflow.targets:
         raise WorkflowError('Target "{}" is not found in the workflow.'.format(target))
 
-    log_file = backend_cls.logs(workflow.targets[target], stderr=stderr)
-    log_contents = log_file.read()
-    log_file.close()
+    with backend_cls.logs(workflow.targets[target], stderr=stderr) as log_file:
+        log_contents = log_file.read()
 
     echo_func = click.echo if no_pager else click.echo_via_pager
     echo_func(log_contents)
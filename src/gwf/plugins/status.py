@@ -45,14 +45,12 @@ def print_table(graph, targets, status_provider):
 
         deps = graph.dfs(target)
         deps_total = len(deps)
+        deps_status_counts = Counter(status_provider(dep) for dep in deps)
 
-        def num_deps_with_status(status):
-            return sum(1 for target in deps if status_provider(target) == status)
-
-        num_shouldrun = num_deps_with_status(TargetStatus.SHOULDRUN)
-        num_submitted = num_deps_with_status(TargetStatus.SUBMITTED)
-        num_running = num_deps_with_status(TargetStatus.RUNNING)
-        num_completed = num_deps_with_status(TargetStatus.COMPLETED)
+        num_shouldrun = deps_status_counts[TargetStatus.SHOULDRUN]
+        num_submitted = deps_status_counts[TargetStatus.SUBMITTED]
+        num_running = deps_status_counts[TargetStatus.RUNNING]
+        num_completed = deps_status_counts[TargetStatus.COMPLETED]
 
         percentage = num_completed / deps_total
 
@@ -69,8 +67,9 @@ def print_table(graph, targets, status_provider):
         click.echo(line)
 
 
-def print_summary(backend, graph, targets):
-    status_counts = Counter(get_status(target, backend=backend) for target in targets)
+def print_summary(targets, status_provider):
+    targets = list(targets)
+    status_counts = Counter(status_provider(target) for target in targets)
     click.echo("{:<15}{:>10}".format("total", len(targets)))
     for status in STATUS_ORDER:
         color = STATUS_COLORS[status]
@@ -117,8 +116,15 @@ def status(obj, status, summary, endpoints, targets):
 
     scheduled, _ = schedule(graph.endpoints(), graph=graph)
 
+    # The status of a target is needed once for the target itself and once for
+    # every target depending on it, so look it up in the backend only once.
+    statuses = {}
+
     def status_provider(target):
-        return get_status(target, scheduled, backend)
+        status = statuses.get(target)
+        if status is None:
+            status = statuses[target] = get_status(target, scheduled, backend)
+        return status
 
     with backend_cls() as backend:
         filters = []
@@ -135,4 +141,4 @@ def status(obj, status, summary, endpoints, targets):
         if not summary:
             print_table(graph, matches, status_provider)
         else:
-            print_summary(graph, matches, status_provider)
+            print_summary(matches, status_provider)
@@ -13,7 +13,6 @@ import time
 from collections import UserDict
 from contextlib import ContextDecorator
 from functools import wraps
-from urllib.request import urlopen
 
 import click
 
@@ -197,6 +196,8 @@ def get_latest_version():
         logger.debug("Skipping check for updates.")
         return None
 
+    from urllib.request import urlopen
+
     logger.debug("Checking for updates.")
     touchfile(UPDATE_CHECK_FILE)
     try:
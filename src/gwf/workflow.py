@@ -1,11 +1,11 @@
-import copy
-import collections
-import collections.abc
+import functools
 import inspect
 import subprocess
 import sys
 import warnings
 import os.path
+from collections.abc import Iterable as _Iterable
+from collections.abc import Mapping as _Mapping
 from glob import glob as _glob
 from glob import iglob as _iglob
 
@@ -41,10 +41,7 @@ def select(lst, fields):
     """
     fields = tuple(fields)
     for item in lst:
-        dct = {}
-        for name in fields:
-            dct[name] = item[name]
-        yield dct
+        yield {name: item[name] for name in fields}
 
 
 def collect(lst, fields, rename=None):
@@ -75,12 +72,26 @@ def collect(lst, fields, rename=None):
     fields = tuple(fields)
     if rename is None:
         rename = {}
-    selected = collections.defaultdict(list)
+
+    selected_names = [rename.get(name, name + "s") for name in fields]
+    selected = {selected_name: [] for selected_name in selected_names}
+    appenders = [
+        (name, selected[selected_name].append)
+        for name, selected_name in zip(fields, selected_names)
+    ]
     for item in lst:
-        for name in fields:
-            selected_name = rename.get(name, name + "s")
-            selected[selected_name].append(item[name])
-    return dict(selected)
+        for name, append in appenders:
+            append(item[name])
+
+    # Nothing is collected from an empty iterable.
+    if selected_names and not selected[selected_names[0]]:
+        return {}
+    return selected
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_dir(filename):
+    return os.path.dirname(os.path.realpath(filename))
 
 
 class TargetList(list):
@@ -175,8 +186,11 @@ class Workflow(object):
             # Get the frame object of whatever called the Workflow.__init__
             # and extract the path of the file which is was defined in. Then
             # normalize the path and get the directory of the file.
-            filename = inspect.getfile(sys._getframe(1))
-            self.working_dir = os.path.dirname(os.path.realpath(filename))
+            filename = sys._getframe(1).f_code.co_filename
+            if os.path.isabs(filename):
+                self.working_dir = _resolve_dir(filename)
+            else:
+                self.working_dir = os.path.dirname(os.path.realpath(filename))
 
     @classmethod
     def from_path(cls, path):
@@ -208,6 +222,26 @@ class Workflow(object):
             )
         self.targets[target.name] = target
 
+    def _add_targets_bulk(self, targets, namespace=None):
+        new_targets = {}
+        for target in targets:
+            if namespace is not None:
+                target.name = target.qualname(namespace)
+            new_targets[target.name] = target
+
+        collisions = sorted(new_targets.keys() & self.targets.keys())
+        if len(collisions) == 1:
+            raise WorkflowError(
+                'Target "{}" already exists in workflow.'.format(collisions[0])
+            )
+        if collisions:
+            raise WorkflowError(
+                "Targets {} already exist in workflow.".format(
+                    ", ".join('"{}"'.format(name) for name in collisions)
+                )
+            )
+        self.targets.update(new_targets)
+
     def target(self, name, inputs, outputs, **options):
         """Create a target and add it to the :class:`gwf.Workflow`.
 
@@ -238,7 +272,8 @@ class Workflow(object):
             options=options,
             working_dir=self.working_dir,
         )
-        new_target.inherit_options(self.defaults)
+        if self.defaults:
+            new_target.inherit_options(self.defaults)
 
         self._add_target(new_target)
         return new_target
@@ -308,7 +343,8 @@ class Workflow(object):
         else:
             raise TypeError("Target `{}` received an invalid template.".format(name))
 
-        new_target.inherit_options(self.defaults)
+        if self.defaults:
+            new_target.inherit_options(self.defaults)
         self._add_target(new_target)
         return new_target
 
@@ -391,39 +427,54 @@ class Workflow(object):
                 "Argument `template_func` must be a function or a callable class instance."
             )
 
-        def template_namer(idx, target):
-            if hasattr(template_func, "__name__"):
-                name = template_func.__name__
-            else:
-                name = template_func.__class__.__name__
-            return "{name}_{idx}".format(name=name, idx=idx)
-
-        def string_namer(idx, target):
-            return "{name}_{idx}".format(name=name, idx=idx)
+        def prefix_namer(idx, target):
+            return "{name}_{idx}".format(name=prefix, idx=idx)
 
         if name is None:
-            name_func = template_namer
+            prefix = getattr(template_func, "__name__", None)
+            if prefix is None:
+                prefix = template_func.__class__.__name__
+            name_func = prefix_namer
         elif isinstance(name, str):
-            name_func = string_namer
+            prefix = name
+            name_func = prefix_namer
         else:
             name_func = name
 
+        def call_with_mapping(args):
+            return template_func(**args, **extra)
+
+        def call_with_iterable(args):
+            return template_func(*args, **extra)
+
+        def call_with_value(args):
+            return template_func(args, **extra)
+
+        def get_caller(args):
+            if isinstance(args, _Mapping):
+                return call_with_mapping
+            elif isinstance(args, _Iterable) and not isinstance(args, str):
+                return call_with_iterable
+            return call_with_value
+
+        # How the template is called only depends on the type of the input, so
+        # the (relatively expensive) ABC checks are done once per input type.
+        callers = {}
+
         targets = TargetList()
+        append = targets.append
         for idx, args in enumerate(inputs):
-            if isinstance(args, collections.abc.Mapping):
-                template = template_func(**args, **extra)
-            elif isinstance(args, collections.abc.Iterable) and not isinstance(
-                args, str
-            ):
-                template = template_func(*args, **extra)
-            else:
-                template = template_func(args, **extra)
+            args_type = type(args)
+            caller = callers.get(args_type)
+            if caller is None:
+                caller = callers[args_type] = get_caller(args)
+            template = caller(args)
 
             target_name = name_func(idx, template)
             target = self.target_from_template(
                 name=target_name, template=template, **kwargs
             )
-            targets.append(target)
+            append(target)
         return targets
 
     def include_path(self, path, namespace=None):
@@ -452,8 +503,10 @@ class Workflow(object):
                 "The included workflow has the same name as this workflow."
             )
 
-        for target in other_workflow.targets.values():
-            self._add_target(copy.deepcopy(target), namespace=namespace_prefix)
+        self._add_targets_bulk(
+            (target.clone() for target in other_workflow.targets.values()),
+            namespace=namespace_prefix,
+        )
 
     def include(self, other_workflow, namespace=None):
         """Include targets from another :class:`gwf.Workflow` into this workflow.
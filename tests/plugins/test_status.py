@@ -45,3 +45,10 @@ def test_status_shows_only_endpoint_targets(cli_runner):
     result = cli_runner.invoke(main, ["-b", "testing", "status", "--endpoints"])
     assert "Target2" in result.output
     assert "Target1" not in result.output
+
+
+def test_status_shows_summary(cli_runner):
+    result = cli_runner.invoke(main, ["-b", "testing", "status", "--summary"])
+    assert result.exit_code == 0
+    assert "total" in result.output
+    assert "shouldrun" in result.output
@@ -1,7 +1,58 @@
-from gwf.cli import main
+import logging
+
+import pytest
+
+from gwf.cli import PluginGroup, get_level, main
+from gwf.exceptions import ConfigurationError
 
 
 def test_main_shows_usage_when_no_subcommand_is_given(cli_runner):
     result = cli_runner.invoke(main, [])
     assert result.exit_code == 0
     assert result.output.startswith("Usage:")
+
+
+def test_main_lists_all_plugin_commands(cli_runner):
+    result = cli_runner.invoke(main, ["--help"])
+    assert result.exit_code == 0
+    for name in ("run", "status", "clean", "cancel", "info", "touch"):
+        assert name in main.list_commands(None)
+        assert name in result.output
+
+
+def test_plugin_group_only_loads_invoked_command(cli_runner):
+    group = PluginGroup(name="gwf")
+    result = cli_runner.invoke(group, ["init", "--help"])
+    assert result.exit_code == 0
+    assert set(group.commands) == {"init"}
+
+
+class FailingEntryPoint:
+    name = "broken"
+
+    def load(self):
+        raise ImportError("No module named 'gwf_broken_plugin'")
+
+
+def test_plugin_group_reports_plugins_that_cannot_be_loaded(cli_runner, mocker):
+    mocker.patch(
+        "gwf.cli.iter_entry_points",
+        side_effect=lambda group, name=None: [FailingEntryPoint()],
+    )
+    group = PluginGroup(name="gwf")
+
+    result = cli_runner.invoke(group, ["--help"])
+    assert result.exit_code == 0
+    assert "could not load plugin" in result.output
+
+    result = cli_runner.invoke(group, ["broken"])
+    assert result.exit_code == 1
+    assert "No module named 'gwf_broken_plugin'" in result.output
+
+
+def test_get_level():
+    assert get_level("warning") == logging.WARNING
+    assert get_level("debug") == logging.DEBUG
+
+    with pytest.raises(ConfigurationError):
+        get_level("loud")
@@ -1,8 +1,18 @@
+import os
+import sys
 import unittest
 
 import pytest
 
-from gwf.core import Graph, Target, TargetStatus, _flatten, get_status
+from gwf.core import (
+    CachedFilesystem,
+    Graph,
+    Scheduler,
+    Target,
+    TargetStatus,
+    _flatten,
+    get_status,
+)
 from gwf.exceptions import NameError, WorkflowError
 
 
@@ -106,6 +116,49 @@ class TestTarget(unittest.TestCase):
         target.inherit_options({"cores": 4, "memory": "4g"})
         self.assertEqual(target.options, {"cores": 8, "memory": "4g"})
 
+    def test_flattened_paths_follow_reassigned_attributes(self):
+        target = Target(
+            "TestTarget",
+            inputs=["a.txt"],
+            outputs={"B": ["b.txt"]},
+            options={},
+            working_dir="/some/dir",
+        )
+        self.assertEqual(target.flattened_inputs(), ["/some/dir/a.txt"])
+        self.assertEqual(target.flattened_outputs(), ["/some/dir/b.txt"])
+
+        target.inputs = ["c.txt"]
+        self.assertEqual(target.flattened_inputs(), ["/some/dir/c.txt"])
+
+        target.working_dir = "/other/dir"
+        self.assertEqual(target.flattened_inputs(), ["/other/dir/c.txt"])
+        self.assertEqual(target.flattened_outputs(), ["/other/dir/b.txt"])
+
+    def test_clone(self):
+        target = Target(
+            "TestTarget",
+            inputs=["a.txt"],
+            outputs=["b.txt"],
+            options={"cores": 8},
+            working_dir="/some/dir",
+            spec="echo hello",
+            protect=["b.txt"],
+        )
+
+        clone = target.clone(name="foo.TestTarget")
+        self.assertEqual(clone.name, "foo.TestTarget")
+        self.assertEqual(clone.inputs, target.inputs)
+        self.assertEqual(clone.outputs, target.outputs)
+        self.assertEqual(clone.working_dir, target.working_dir)
+        self.assertEqual(clone.spec, target.spec)
+        self.assertEqual(clone.order, target.order)
+
+        clone.options["cores"] = 2
+        clone.protected.add("a.txt")
+        self.assertEqual(target.name, "TestTarget")
+        self.assertEqual(target.options, {"cores": 8})
+        self.assertEqual(target.protected, {"b.txt"})
+
     def test_str_on_target(self):
         target = Target(
             "TestTarget", inputs=[], outputs=[], options={}, working_dir="/some/path"
@@ -261,6 +314,21 @@ def test_graph_raises_circular_dependency_error(graph_factory):
         Graph.from_targets({"Target1": t1, "Target2": t2, "Target3": t3})
 
 
+def test_graph_handles_dependency_chains_deeper_than_recursion_limit(graph_factory):
+    targets = [
+        Target(
+            name="Target{}".format(idx),
+            inputs=["f{}.txt".format(idx - 1)] if idx else [],
+            outputs=["f{}.txt".format(idx)],
+            options={},
+            working_dir="/some/dir",
+        )
+        for idx in range(sys.getrecursionlimit() + 100)
+    ]
+    graph = graph_factory(targets)
+    assert graph.dfs(targets[-1]) == targets
+
+
 def test_graph_raises_when_two_targets_output_the_same_file(graph_factory):
     target1 = Target(
         "TestTarget1",
@@ -297,6 +365,36 @@ def test_graph_subset(diamond_graph):
     assert set([target1, target2, target3, target4]) == set(g3.targets.values())
 
 
+def test_graph_topological_order(diamond_graph):
+    target1 = diamond_graph.targets["TestTarget1"]
+    target2 = diamond_graph.targets["TestTarget2"]
+    target3 = diamond_graph.targets["TestTarget3"]
+    target4 = diamond_graph.targets["TestTarget4"]
+
+    order = diamond_graph.topological_order()
+    assert len(order) == 4
+    assert order[0] == target1
+    assert {order[1], order[2]} == {target2, target3}
+    assert order[3] == target4
+
+    assert diamond_graph.endpoints() == {target4}
+
+
+def test_graph_dfs(diamond_graph):
+    target1 = diamond_graph.targets["TestTarget1"]
+    target2 = diamond_graph.targets["TestTarget2"]
+    target3 = diamond_graph.targets["TestTarget3"]
+    target4 = diamond_graph.targets["TestTarget4"]
+
+    assert diamond_graph.dfs(target1) == [target1]
+    assert diamond_graph.dfs(target2) == [target1, target2]
+
+    path = diamond_graph.dfs(target4)
+    assert path[0] == target1
+    assert set(path[1:3]) == {target2, target3}
+    assert path[3] == target4
+
+
 def test_schedule_if_one_of_its_output_files_does_not_exist(diamond_graph, schedule):
     target = diamond_graph.targets["TestTarget1"]
     scheduled, reasons = schedule([target], diamond_graph)
@@ -483,6 +581,51 @@ def test_scheduling_multiple_targets(diamond_graph, schedule):
     assert len(scheduled) == 3
 
 
+def test_scheduler_should_schedule(diamond_graph, filesystem):
+    filesystem.add_file("/some/dir/test_output1.txt", changed_at=0)
+    filesystem.add_file("/some/dir/test_output2.txt", changed_at=1)
+
+    scheduler = Scheduler(filesystem=filesystem)
+    target2 = diamond_graph.targets["TestTarget2"]
+    target4 = diamond_graph.targets["TestTarget4"]
+
+    assert scheduler.should_schedule(target2, diamond_graph) == (
+        False,
+        "TestTarget2 was not scheduled because it is up to date",
+    )
+    should_run, reason = scheduler.should_schedule(target4, diamond_graph)
+    assert should_run
+    assert reason == (
+        "TestTarget4 was scheduled because its dependency TestTarget3 was scheduled"
+    )
+
+
+def test_scheduler_should_schedule_decides_each_target_once(
+    graph_factory, filesystem, mocker
+):
+    targets = [
+        Target(
+            name="Target{}".format(idx),
+            inputs=["f{}.txt".format(idx - 1)] if idx else [],
+            outputs=["f{}.txt".format(idx)],
+            options={},
+            working_dir="/some/dir",
+        )
+        for idx in range(sys.getrecursionlimit() + 100)
+    ]
+    graph = graph_factory(targets)
+
+    scheduler = Scheduler(filesystem=filesystem)
+    schedule_target = mocker.spy(scheduler, "_schedule_target")
+    dfs = mocker.spy(Graph, "dfs")
+
+    assert scheduler.should_schedule(targets[-1], graph)[0]
+    for target in targets:
+        assert scheduler.should_schedule(target, graph)[0]
+    assert schedule_target.call_count == len(targets)
+    assert dfs.call_count == 0
+
+
 def test_get_status(backend):
     target = Target(
         "TestTarget", inputs=[], outputs=[], options={}, working_dir="/some/dir"
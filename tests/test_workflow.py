@@ -1,7 +1,10 @@
+import os.path
+
 import pytest
 from unittest.mock import Mock, patch
 
 from gwf import AnonymousTarget, Workflow
+from gwf.workflow import collect
 from gwf.exceptions import TypeError, WorkflowError
 
 
@@ -121,6 +124,33 @@ def test_include_target_from_workflow_in_two_different_workflows_():
     assert w2.targets["foo.MyTarget"].name == "foo.MyTarget"
 
 
+def test_including_workflow_with_existing_target_names_raises_an_exception():
+    workflow = Workflow(working_dir="/some/dir")
+    workflow.target("foo.TestTarget1", inputs=[], outputs=[])
+
+    other_workflow = Workflow(name="foo", working_dir="/some/dir")
+    other_workflow.target("TestTarget1", inputs=[], outputs=[])
+    other_workflow.target("TestTarget2", inputs=[], outputs=[])
+
+    with pytest.raises(WorkflowError):
+        workflow.include_workflow(other_workflow)
+    assert set(workflow.targets) == {"foo.TestTarget1"}
+
+
+def test_including_workflow_reports_all_existing_target_names():
+    workflow = Workflow(working_dir="/some/dir")
+    workflow.target("foo.TestTarget1", inputs=[], outputs=[])
+    workflow.target("foo.TestTarget2", inputs=[], outputs=[])
+
+    other_workflow = Workflow(name="foo", working_dir="/some/dir")
+    other_workflow.target("TestTarget1", inputs=[], outputs=[])
+    other_workflow.target("TestTarget2", inputs=[], outputs=[])
+
+    with pytest.raises(WorkflowError) as excinfo:
+        workflow.include_workflow(other_workflow)
+    assert '"foo.TestTarget1", "foo.TestTarget2"' in str(excinfo.value)
+
+
 def test_including_workflow_with_same_name_as_this_workflow_raises_an_exception():
     workflow = Workflow(name="foo")
     other_workflow = Workflow(name="foo")
@@ -212,17 +242,21 @@ def test_target_options_override_defaults():
 
 
 @patch("gwf.workflow.sys._getframe", autospec=True)
-@patch("gwf.workflow.inspect.getfile", return_value="/some/path/file.py", autospec=True)
 def test_workflow_computes_working_dir_when_not_initialized_with_working_dir(
-    inspect_getfile_mock, sys_getframe_mock
+    sys_getframe_mock,
 ):
+    sys_getframe_mock.return_value.f_code.co_filename = "/some/path/file.py"
     workflow = Workflow()
 
     assert sys_getframe_mock.call_count == 1
-    assert inspect_getfile_mock.call_count == 1
     assert workflow.working_dir == "/some/path"
 
 
+def test_workflow_working_dir_defaults_to_directory_of_calling_file():
+    workflow = Workflow()
+    assert workflow.working_dir == os.path.dirname(os.path.realpath(__file__))
+
+
 @patch("gwf.workflow._glob", autospec=True)
 def test_glob_with_relative_path_searches_relative_to_working_dir(glob_mock):
     workflow = Workflow(working_dir="/some/path")
@@ -379,6 +413,23 @@ def test_map_arg_passing_list_of_tuples(mocker, mock_template):
     )
 
 
+def test_map_arg_passing_list_of_mixed_inputs(mocker, mock_template):
+    files = ["a", ("b", "/foo"), {"path": "c"}, "d"]
+
+    workflow = Workflow(working_dir="/some/dir")
+    workflow.map(mock_template, files)
+
+    mock_template.assert_has_calls(
+        [
+            mocker.call("a"),
+            mocker.call("b", "/foo"),
+            mocker.call(path="c"),
+            mocker.call("d"),
+        ],
+        any_order=True,
+    )
+
+
 def test_map_arg_passing_list_of_dicts(mocker, mock_template):
     files = [
         {"path": "a", "output_dir": "foo/"},
@@ -437,3 +488,12 @@ def test_target_list():
 
     assert len(target_list.inputs) == 3
     assert target_list.inputs == [{"path": "a"}, {"path": "b"}, {"path": "c"}]
+
+
+def test_collect():
+    lst = [{"A": "a1", "B": "b1"}, {"A": "a2", "B": "b2"}]
+
+    assert collect(lst, ["A", "B"]) == {"As": ["a1", "a2"], "Bs": ["b1", "b2"]}
+    assert collect(lst, ["A"], rename={"A": "foo"}) == {"foo": ["a1", "a2"]}
+    assert collect(iter(lst), ["B"]) == {"Bs": ["b1", "b2"]}
+    assert collect([], ["A"]) == {}